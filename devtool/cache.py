@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+DevTool result cache
+
+Small on-disk JSON cache for subprocess results (git worktrees, docker
+containers) so repeated `devtool list` calls don't re-shell out every time.
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_DIR = Path("~/.cache/devtool").expanduser()
+
+def _entry_path(key: str, namespace: str) -> Path:
+    """Return the cache file for a key within a namespace."""
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / namespace / f"{digest}.json"
+
+def get(key: str, namespace: str = "worktrees", ttl: float = 300,
+        mtime: Optional[float] = None) -> Optional[Any]:
+    """Return the cached value for key, or None if missing, expired or stale.
+
+    When mtime is given, the entry is only valid if it was stored with the
+    same mtime (e.g. of the repo's .git/HEAD).
+    """
+    try:
+        with open(_entry_path(key, namespace), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    created = entry.get("created")
+    if not isinstance(created, (int, float)):
+        return None
+    age = time.time() - created
+    if age < 0 or age > ttl:  # A future timestamp can't be trusted either
+        return None
+    if mtime is not None and entry.get("mtime") != mtime:
+        return None
+    return entry.get("value")
+
+def insert(key: str, value: Any, namespace: str = "worktrees",
+           mtime: Optional[float] = None) -> None:
+    """Store value for key. Failures to write the cache are ignored."""
+    path = _entry_path(key, namespace)
+    entry = {"key": key, "created": time.time(), "mtime": mtime, "value": value}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -8,9 +8,26 @@ import argparse
 import subprocess
 import json
 import os
+import shutil
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, List, Dict, Optional
 from pathlib import Path
 
+try:
+    from devtool import cache
+except ImportError:  # Running as a script (devtool/cli.py)
+    import cache
+
+WORKTREE_CACHE_TTL = 300  # seconds; also invalidated by .git/HEAD mtime
+CONTAINER_CACHE_TTL = 10  # seconds; containers change more often
+STATUS_CACHE_TTL = 30  # seconds; daemon up/down probe for `devtool status`
+
+# Tab-separated `docker ps` output is split directly, no JSON parsing needed
+DOCKER_PS_FIELDS = ('id', 'name', 'image', 'status', 'ports')
+DOCKER_PS_FORMAT = "{{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}"
+
 def run_command(cmd: List[str], capture_output: bool = True, cwd: Optional[str] = None) -> subprocess.CompletedProcess:
     """Run a shell command and return the result."""
     try:
@@ -18,33 +35,77 @@ def run_command(cmd: List[str], capture_output: bool = True, cwd: Optional[str]
     except subprocess.CalledProcessError as e:
         return e
 
-def get_docker_containers() -> List[Dict[str, str]]:
+def get_docker_containers(use_cache: bool = True) -> List[Dict[str, str]]:
     """Get list of running Docker containers."""
-    result = run_command(["docker", "ps", "--format", "json"])
+    host = socket.gethostname()
+    if use_cache:
+        cached = cache.get(host, namespace="containers", ttl=CONTAINER_CACHE_TTL)
+        if cached is not None:
+            return cached
+    
+    result = run_command(["docker", "ps", "--format", DOCKER_PS_FORMAT])
     if result.returncode != 0:
         return []
     
     containers = []
-    for line in result.stdout.strip().split('\n'):
-        if line.strip():
+    for line in result.stdout.splitlines():
+        if line.startswith('{'):
+            # Older output from `--format json`
             try:
                 container = json.loads(line)
-                containers.append({
-                    'id': container.get('ID', ''),
-                    'name': container.get('Names', ''),
-                    'image': container.get('Image', ''),
-                    'status': container.get('Status', ''),
-                    'ports': container.get('Ports', '')
-                })
             except json.JSONDecodeError:
                 continue
+            containers.append({
+                'id': container.get('ID', ''),
+                'name': container.get('Names', ''),
+                'image': container.get('Image', ''),
+                'status': container.get('Status', ''),
+                'ports': container.get('Ports', '')
+            })
+            continue
+        parts = line.split('\t', 4)
+        if len(parts) == len(DOCKER_PS_FIELDS):
+            containers.append(dict(zip(DOCKER_PS_FIELDS, parts)))
+    cache.insert(host, containers, namespace="containers")
     return containers
 
-def get_git_worktrees(repo_path: str) -> List[Dict[str, str]]:
+def worktree_state_mtime(repo_path: str) -> Optional[float]:
+    """Return the newest mtime of the git files that change with the worktree list.
+
+    .git/HEAD changes on checkout in the main worktree, .git/worktrees on
+    `git worktree add/remove`, and .git/worktrees/<name>/HEAD on checkout
+    inside a linked worktree. None if the repo has no .git/HEAD.
+    """
+    git_dir = os.path.join(repo_path, ".git")
+    try:
+        newest = os.stat(os.path.join(git_dir, "HEAD")).st_mtime
+    except OSError:
+        return None
+    
+    worktrees_dir = os.path.join(git_dir, "worktrees")
+    try:
+        newest = max(newest, os.stat(worktrees_dir).st_mtime)
+        with os.scandir(worktrees_dir) as entries:
+            for entry in entries:
+                try:
+                    newest = max(newest, os.stat(os.path.join(entry.path, "HEAD")).st_mtime)
+                except OSError:
+                    continue
+    except OSError:
+        pass  # No linked worktrees
+    return newest
+
+def get_git_worktrees(repo_path: str, use_cache: bool = True) -> List[Dict[str, str]]:
     """Get list of Git worktrees for a repository."""
     if not os.path.exists(repo_path):
         return []
     
+    head_mtime = worktree_state_mtime(repo_path)
+    if use_cache and head_mtime is not None:
+        cached = cache.get(repo_path, ttl=WORKTREE_CACHE_TTL, mtime=head_mtime)
+        if cached is not None:
+            return cached
+    
     result = run_command(["git", "worktree", "list"], cwd=repo_path)
     if result.returncode != 0:
         return []
@@ -66,30 +127,90 @@ def get_git_worktrees(repo_path: str) -> List[Dict[str, str]]:
                     'branch': branch,
                     'commit': commit
                 })
+    if head_mtime is not None:
+        cache.insert(repo_path, worktrees, mtime=head_mtime)
     return worktrees
 
-def find_repos_in_workspace(workspace_dir: str = "~/dev") -> List[str]:
-    """Find Git repositories in the workspace directory."""
+# Directories that never contain repos worth listing and can be huge
+SKIP_DIRS = {'node_modules', '.venv', 'venv', '__pycache__', 'target'}
+
+def find_repos_in_workspace(workspace_dir: str = "~/dev", max_depth: int = 4) -> List[str]:
+    """Find Git repositories in the workspace directory, up to max_depth levels deep."""
     workspace_path = os.path.expanduser(workspace_dir)
-    repos = []
     
     if not os.path.exists(workspace_path):
-        return repos
+        return []
+    
+    # Where supported (Linux, macOS), walk by directory fd so each level is
+    # opened relative to its parent instead of re-resolving the full path.
+    # Elsewhere (Windows) fall back to path-based scandir.
+    use_fds = os.scandir in os.supports_fd and os.open in os.supports_dir_fd
+    open_flags = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+    
+    def list_subdirs(dir_ref) -> Optional[List[str]]:
+        """Return child directory names, or None if dir_ref is a repo."""
+        # scandir's cached d_type lets us test for directories without a stat per entry
+        names = []
+        with os.scandir(dir_ref) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == '.git':
+                    return None  # Don't recurse into subdirs of found repos
+                if entry.name not in SKIP_DIRS:
+                    names.append(entry.name)
+        return names
     
-    for root, dirs, files in os.walk(workspace_path):
-        if '.git' in dirs:
-            repos.append(root)
-            dirs[:] = []  # Don't recurse into subdirs of found repos
+    def scan(path: str, depth: int, dir_fd: Optional[int]):
+        try:
+            names = list_subdirs(path if dir_fd is None else dir_fd)
+        except OSError:
+            return
+        if names is None:
+            yield path
+            return
+        if depth >= max_depth:
+            return
+        for name in sorted(names):
+            child_path = os.path.join(path, name)
+            if dir_fd is None:
+                yield from scan(child_path, depth + 1, None)
+                continue
+            try:
+                child_fd = os.open(name, open_flags, dir_fd=dir_fd)
+            except OSError:
+                continue
+            try:
+                yield from scan(child_path, depth + 1, child_fd)
+            finally:
+                os.close(child_fd)
+    
+    if not use_fds:
+        return list(scan(workspace_path, 0, None))
     
-    return repos
+    try:
+        root_fd = os.open(workspace_path, open_flags)
+    except OSError:
+        return []
+    try:
+        return list(scan(workspace_path, 0, root_fd))
+    finally:
+        os.close(root_fd)
 
 def cmd_list(args: argparse.Namespace) -> None:
     """List active sessions and resources."""
     print("🔍 DevTool Session Discovery")
     print("=" * 50)
     
+    # Docker and git lookups are subprocess-bound, so run them concurrently
+    use_cache = not getattr(args, 'no_cache', False)
+    repos = find_repos_in_workspace()
+    with ThreadPoolExecutor(max_workers=min(32, len(repos) + 1)) as executor:
+        containers_future = executor.submit(get_docker_containers, use_cache=use_cache)
+        worktree_map = dict(zip(repos, executor.map(partial(get_git_worktrees, use_cache=use_cache), repos)))
+        containers = containers_future.result()
+    
     # Docker containers
-    containers = get_docker_containers()
     print(f"\n🐳 Docker Containers ({len(containers)} found):")
     if containers:
         for container in containers:
@@ -98,33 +219,45 @@ def cmd_list(args: argparse.Namespace) -> None:
         print("  No running containers found")
     
     # Git repositories and worktrees
-    repos = find_repos_in_workspace()
     print(f"\n📁 Git Repositories ({len(repos)} found):")
     for repo in repos:
         print(f"  • {os.path.basename(repo)}")
-        worktrees = get_git_worktrees(repo)
+        worktrees = worktree_map[repo]
         if len(worktrees) > 1:  # More than just main worktree
             for wt in worktrees[1:]:  # Skip main worktree
                 print(f"    └─ worktree: {os.path.basename(wt['path'])} ({wt['branch']})")
 
+def docker_available(use_cache: bool = True) -> bool:
+    """Check whether the Docker daemon is reachable."""
+    if shutil.which("docker") is None:
+        return False
+    if use_cache:
+        cached = cache.get("docker", namespace="status", ttl=STATUS_CACHE_TTL)
+        if cached is not None:
+            return cached
+    
+    # `docker version` fails fast when the daemon is down and returns far less than `docker info`
+    result = run_command(["docker", "version", "--format", "{{.Server.Version}}"])
+    available = result.returncode == 0
+    cache.insert("docker", available, namespace="status")
+    return available
+
 def cmd_status(args: argparse.Namespace) -> None:
     """Show system status overview."""
     print("📊 DevTool System Status")
     print("=" * 50)
     
     # Docker status
-    docker_result = run_command(["docker", "info"])
-    docker_ok = docker_result.returncode == 0
+    docker_ok = docker_available(use_cache=not getattr(args, 'no_cache', False))
     print(f"🐳 Docker: {'✅ Running' if docker_ok else '❌ Not available'}")
     
     # Git status
-    git_result = run_command(["git", "--version"])
-    git_ok = git_result.returncode == 0
+    git_ok = shutil.which("git") is not None
     print(f"📦 Git: {'✅ Available' if git_ok else '❌ Not available'}")
     
     # Workspace
     workspace = os.path.expanduser("~/dev")
-    workspace_exists = os.path.exists(workspace)
+    workspace_exists = os.path.isdir(workspace)
     print(f"📁 Workspace: {'✅ ' + workspace if workspace_exists else '❌ ~/dev not found'}")
     
     # Summary
@@ -146,9 +279,19 @@ def main() -> None:
     
     # List command
     list_parser = subparsers.add_parser('list', help='List active sessions and resources')
+    list_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached results and query git/docker directly."
+    )
     
     # Status command  
     status_parser = subparsers.add_parser('status', help='Show system status overview')
+    status_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the cached Docker probe and check the daemon directly."
+    )
     
     # Legacy message option (for backward compatibility)
     parser.add_argument(
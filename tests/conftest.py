@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for DevTool tests
+"""
+import pytest
+from devtool import cache
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the result cache out of the real ~/.cache during tests."""
+    monkeypatch.setattr(cache, 'CACHE_DIR', tmp_path / 'cache')
+    return tmp_path / 'cache'
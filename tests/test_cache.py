@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the DevTool result cache
+"""
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+from devtool import cache
+from devtool.cli import get_git_worktrees, get_docker_containers
+
+class TestCache:
+    """Test cache get/insert."""
+    
+    def test_roundtrip(self):
+        """Test that an inserted value is returned."""
+        cache.insert('/repo', [{'path': '/repo'}])
+        assert cache.get('/repo') == [{'path': '/repo'}]
+    
+    def test_missing_key(self):
+        """Test that an unknown key is a miss."""
+        assert cache.get('/nowhere') is None
+    
+    def test_expired_entry(self):
+        """Test that entries older than the TTL are a miss."""
+        with patch('devtool.cache.time.time', return_value=1000.0):
+            cache.insert('/repo', ['value'])
+        with patch('devtool.cache.time.time', return_value=1301.0):
+            assert cache.get('/repo', ttl=300) is None
+    
+    def test_non_object_entry(self):
+        """Test that a cache file holding valid non-object JSON is a miss."""
+        cache.insert('/repo', ['value'])
+        cache._entry_path('/repo', 'worktrees').write_text('[1, 2]')
+        assert cache.get('/repo') is None
+    
+    def test_future_entry(self):
+        """Test that entries created in the future are a miss."""
+        with patch('devtool.cache.time.time', return_value=2000.0):
+            cache.insert('/repo', ['value'])
+        with patch('devtool.cache.time.time', return_value=1000.0):
+            assert cache.get('/repo') is None
+    
+    def test_mtime_mismatch(self):
+        """Test that a changed mtime invalidates the entry."""
+        cache.insert('/repo', ['value'], mtime=1.0)
+        assert cache.get('/repo', mtime=1.0) == ['value']
+        assert cache.get('/repo', mtime=2.0) is None
+    
+    def test_namespaces_are_separate(self):
+        """Test that the same key in different namespaces does not collide."""
+        cache.insert('key', ['worktree'])
+        assert cache.get('key', namespace='containers') is None
+
+class TestCachedLookups:
+    """Test cache use in the CLI lookups."""
+    
+    @patch('devtool.cli.run_command')
+    def test_worktrees_cached_until_head_changes(self, mock_run, tmp_path):
+        """Test that worktrees are served from cache until .git/HEAD changes."""
+        head = tmp_path / '.git' / 'HEAD'
+        head.parent.mkdir()
+        head.write_text('ref: refs/heads/main\n')
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = f'{tmp_path} 1234567 [main]'
+        mock_run.return_value = mock_result
+        
+        first = get_git_worktrees(str(tmp_path))
+        assert get_git_worktrees(str(tmp_path)) == first
+        assert mock_run.call_count == 1
+        
+        os.utime(head, (12345.0, 12345.0))
+        get_git_worktrees(str(tmp_path))
+        assert mock_run.call_count == 2
+    
+    @patch('devtool.cli.run_command')
+    def test_worktrees_cache_invalidated_by_linked_worktrees(self, mock_run, tmp_path):
+        """Test that adding a linked worktree or checking out inside one refreshes the cache."""
+        git_dir = tmp_path / '.git'
+        git_dir.mkdir()
+        (git_dir / 'HEAD').write_text('ref: refs/heads/main\n')
+        os.utime(git_dir / 'HEAD', (1000.0, 1000.0))
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = f'{tmp_path} 1234567 [main]'
+        mock_run.return_value = mock_result
+        
+        get_git_worktrees(str(tmp_path))
+        assert mock_run.call_count == 1
+        
+        # `git worktree add` creates .git/worktrees/<name>
+        linked_head = git_dir / 'worktrees' / 'feat' / 'HEAD'
+        linked_head.parent.mkdir(parents=True)
+        linked_head.write_text('ref: refs/heads/feat\n')
+        os.utime(linked_head, (2000.0, 2000.0))
+        os.utime(git_dir / 'worktrees', (2000.0, 2000.0))
+        get_git_worktrees(str(tmp_path))
+        assert mock_run.call_count == 2
+        get_git_worktrees(str(tmp_path))
+        assert mock_run.call_count == 2
+        
+        # Checkout inside the linked worktree only touches its own HEAD
+        os.utime(linked_head, (3000.0, 3000.0))
+        get_git_worktrees(str(tmp_path))
+        assert mock_run.call_count == 3
+    
+    @patch('devtool.cli.run_command')
+    def test_containers_no_cache(self, mock_run):
+        """Test that use_cache=False always queries docker."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = ''
+        mock_run.return_value = mock_result
+        
+        get_docker_containers()
+        get_docker_containers()
+        assert mock_run.call_count == 1
+        get_docker_containers(use_cache=False)
+        assert mock_run.call_count == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__])
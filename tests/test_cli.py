@@ -10,6 +10,7 @@ from devtool.cli import (
     get_docker_containers, 
     get_git_worktrees, 
     find_repos_in_workspace,
+    docker_available,
     cmd_list,
     cmd_status
 )
@@ -43,6 +44,20 @@ class TestDockerContainers:
         assert len(containers) == 1
         assert containers[0]['name'] == 'test-container'
     
+    @patch('devtool.cli.run_command')
+    def test_get_docker_containers_tab_format(self, mock_run):
+        """Test parsing tab-separated Docker container listing."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = 'abc123\tweb\tnginx\tUp 2 hours\t0.0.0.0:8080->80/tcp\ndef456\tdb\tpostgres\tUp 1 hour\t\n'
+        mock_run.return_value = mock_result
+        
+        containers = get_docker_containers()
+        assert len(containers) == 2
+        assert containers[0] == {'id': 'abc123', 'name': 'web', 'image': 'nginx',
+                                 'status': 'Up 2 hours', 'ports': '0.0.0.0:8080->80/tcp'}
+        assert containers[1]['ports'] == ''
+    
     @patch('devtool.cli.run_command')
     def test_get_docker_containers_no_containers(self, mock_run):
         """Test when no containers are running."""
@@ -54,6 +69,30 @@ class TestDockerContainers:
         containers = get_docker_containers()
         assert len(containers) == 0
 
+class TestDockerAvailable:
+    """Test the Docker daemon probe."""
+    
+    @patch('devtool.cli.run_command')
+    @patch('shutil.which', return_value='/usr/bin/docker')
+    def test_docker_available_cached(self, mock_which, mock_run):
+        """Test that the daemon probe result is cached."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_run.return_value = mock_result
+        
+        assert docker_available()
+        assert docker_available()
+        assert mock_run.call_count == 1
+        assert docker_available(use_cache=False)
+        assert mock_run.call_count == 2
+    
+    @patch('devtool.cli.run_command')
+    @patch('shutil.which', return_value=None)
+    def test_docker_not_installed(self, mock_which, mock_run):
+        """Test that a missing docker binary is reported without running it."""
+        assert not docker_available()
+        assert not mock_run.called
+
 class TestGitWorktrees:
     """Test Git worktree discovery."""
     
@@ -82,19 +121,39 @@ class TestGitWorktrees:
 class TestRepoDiscovery:
     """Test repository discovery in workspace."""
     
-    @patch('os.path.exists')
-    @patch('os.walk')
-    def test_find_repos_in_workspace(self, mock_walk, mock_exists):
+    def test_find_repos_in_workspace(self, tmp_path):
         """Test finding repositories in workspace."""
-        mock_exists.return_value = True
-        mock_walk.return_value = [
-            ('/home/user/dev', ['.git', 'subdir'], []),
-            ('/home/user/dev/subdir', ['.git'], [])
-        ]
+        (tmp_path / 'alpha' / '.git').mkdir(parents=True)
+        (tmp_path / 'group' / 'beta' / '.git').mkdir(parents=True)
+        (tmp_path / 'alpha' / 'nested' / '.git').mkdir(parents=True)
+        (tmp_path / 'notes.txt').write_text('not a repo')
         
-        repos = find_repos_in_workspace('/home/user/dev')
+        repos = find_repos_in_workspace(str(tmp_path))
         assert len(repos) == 2
-        assert '/home/user/dev' in repos
+        assert str(tmp_path / 'alpha') in repos
+        assert str(tmp_path / 'group' / 'beta') in repos
+    
+    def test_find_repos_skips_and_max_depth(self, tmp_path):
+        """Test that skipped dirs and repos deeper than max_depth are ignored."""
+        (tmp_path / 'node_modules' / 'pkg' / '.git').mkdir(parents=True)
+        (tmp_path / 'a' / 'b' / '.git').mkdir(parents=True)
+        
+        assert find_repos_in_workspace(str(tmp_path)) == [str(tmp_path / 'a' / 'b')]
+        assert find_repos_in_workspace(str(tmp_path), max_depth=1) == []
+    
+    def test_find_repos_without_fd_support(self, tmp_path):
+        """Test the path-based fallback used where scandir can't take an fd."""
+        (tmp_path / 'alpha' / '.git').mkdir(parents=True)
+        (tmp_path / 'group' / 'beta' / '.git').mkdir(parents=True)
+        
+        with_fds = find_repos_in_workspace(str(tmp_path))
+        with patch('os.supports_fd', set()):
+            without_fds = find_repos_in_workspace(str(tmp_path))
+        assert with_fds == without_fds == [str(tmp_path / 'alpha'), str(tmp_path / 'group' / 'beta')]
+    
+    def test_find_repos_missing_workspace(self, tmp_path):
+        """Test when the workspace directory doesn't exist."""
+        assert find_repos_in_workspace(str(tmp_path / 'missing')) == []
 
 class TestCLICommands:
     """Test CLI command functions."""
@@ -112,7 +171,27 @@ class TestCLICommands:
         
         # Verify print was called (we don't need to check exact output)
         assert mock_print.called
-    
+
+    @patch('builtins.print')
+    @patch('devtool.cli.get_git_worktrees')
+    @patch('devtool.cli.get_docker_containers')
+    @patch('devtool.cli.find_repos_in_workspace')
+    def test_cmd_list_worktrees_per_repo(self, mock_find_repos, mock_get_containers, mock_get_worktrees, mock_print):
+        """Test that each repo's worktrees are listed under that repo."""
+        mock_get_containers.return_value = []
+        mock_find_repos.return_value = ['/path/to/alpha', '/path/to/beta']
+        mock_get_worktrees.side_effect = lambda repo, **kwargs: [
+            {'path': repo, 'branch': 'main', 'commit': 'abc'},
+            {'path': repo + '-wt', 'branch': 'feature', 'commit': 'def'}
+        ]
+
+        args = MagicMock()
+        cmd_list(args)
+
+        output = [call.args[0] for call in mock_print.call_args_list if call.args]
+        assert mock_get_worktrees.call_count == 2
+        assert output.index("  • alpha") < output.index("    └─ worktree: alpha-wt (feature)") < output.index("  • beta")
+
     @patch('builtins.print')
     @patch('devtool.cli.run_command')
     @patch('os.path.exists')